@@ -1,31 +1,207 @@
 import argparse
+import asyncio
+import heapq
+import re
+import secrets
+import shlex
+import shutil
 import subprocess
-import schedule
-import time
+import sys
 import logging
 import os
 import hashlib
+import importlib.util
+from functools import lru_cache
 import yaml
-from deepdiff import DeepDiff
-import requests
 import json
+from collections.abc import Set as AbstractSet
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C extension
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson  # Faster JSON parsing/serialization when installed
+except ImportError:
+    orjson = None
+
+# msgspec is the C JSON backend used when orjson is not installed
+msgspec = None
+if orjson is None:
+    try:
+        import msgspec
+        import msgspec.json
+    except ImportError:
+        msgspec = None
+
+# Suffix of the JSON cache written next to YAML baselines
+SIDECAR_SUFFIX = '.cache.json'
+
+# Default cap on the number of differences DeepDiff reports per check
+DEFAULT_MAX_DIFFS = 100
+
+# Parsed baselines keyed by (path, format), with the mtime or HTTP validators they were loaded with
+# and their content digest
+_BASELINE_CACHE = {}
+
+# Characters that need a shell to interpret; commands containing any of them are run through bash
+_SHELL_SYNTAX = re.compile(r'[|&;<>()$`*?\[\]{}~!#\n]')
+
+# Bash builtins and keywords; these only exist inside bash, so commands starting with them are run through it
+_BASH_BUILTINS = frozenset("""
+    . : [ alias bg bind break builtin caller cd command compgen complete compopt continue declare dirs
+    disown echo enable eval exec exit export false fc fg getopts hash help history jobs kill let local
+    logout mapfile popd printf pushd pwd read readarray readonly return set shift shopt source suspend
+    test times trap true type typeset ulimit umask unalias unset wait
+    if then else elif fi case esac for select while until do done in function time { } ! [[ ]] coproc
+""".split())
+
+# Number of leading bytes inspected when autodetecting the command output format
+AUTODETECT_PEEK_SIZE = 1024
+
+# Largest command output (bytes) the persistent shell will buffer while looking for its sentinel
+PERSISTENT_SHELL_LIMIT = 64 * 1024 * 1024
+
+# Chunk size for reading command output
+READ_CHUNK_SIZE = 64 * 1024
+
+# Shared HTTP session for remote baselines
+_HTTP_SESSION = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def get_http_session():
+    """
+    Returns the shared requests session so remote fetches reuse keep-alive connections across checks.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests  # Imported lazily; only remote baselines need it
+        _HTTP_SESSION = requests.Session()
+    return _HTTP_SESSION
+
+def json_loads(content):
+    """
+    Parses JSON content (str or bytes), using orjson or msgspec when available.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(content)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), '', 0) from None
+    return json.loads(content)
+
+def json_dumps(obj, pretty=False):
+    """
+    Serializes an object to JSON bytes, using orjson (or msgspec for compact output) when available.
+
+    Compact output is strict; pretty (indented) output is meant for reports and
+    falls back to _json_default for types JSON does not support and coerces non-string keys, like json.dump.
+    """
+    if orjson is not None:
+        if pretty:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=_json_default)
+        return orjson.dumps(obj)
+    if msgspec is not None and not pretty:
+        return msgspec.json.encode(obj)
+    if pretty:
+        return json.dumps(obj, indent=2, default=_json_default).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def config_digest(config):
+    """
+    Computes a digest of a canonical (key-sorted) JSON serialization of a configuration.
+
+    Equal digests mean the configurations are identical, so the diff can be skipped.
+
+    Args:
+        config: The parsed configuration.
+
+    Returns:
+        bytes: The digest.  Returns None if no canonical serialization is available
+        (orjson is not installed, or the data has types JSON cannot represent unambiguously).
+    """
+    if orjson is None:
+        return None
+    try:
+        data = orjson.dumps(config, option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError:
+        return None
+    return hashlib.blake2b(data).digest()
+
+def baseline_digest(entry):
+    """
+    Returns the digest of a loaded baseline, computed once and kept in its cache entry.
+
+    Args:
+        entry (dict): The baseline cache entry returned by load_baseline_entry.
+    """
+    if 'digest' not in entry:
+        entry['digest'] = config_digest(entry['baseline'])
+    return entry['digest']
+
+def _json_default(obj):
+    """
+    Serializes types that JSON does not support natively (e.g., DeepDiff's ordered sets).
+    """
+    if isinstance(obj, AbstractSet):
+        return list(obj)
+    return str(obj)
+
 def setup_argparse():
     """
     Sets up the argument parser for the command-line interface.
     """
     parser = argparse.ArgumentParser(description="A simple scheduler that periodically runs a user-defined command and compares the output to a baseline.")
-    parser.add_argument("command", help="The command to execute (e.g., 'cat /etc/config.txt').  Ensure it's safe and doesn't expose sensitive info if it fails.")
-    parser.add_argument("baseline", help="Path to the baseline file (YAML or JSON).")
+    parser.add_argument("command", nargs='?', help="The command to execute (e.g., 'cat /etc/config.txt').  Ensure it's safe and doesn't expose sensitive info if it fails.")
+    parser.add_argument("baseline", nargs='?', help="Path to the baseline file (YAML or JSON).")
+    parser.add_argument("--jobs", help="Path to a YAML or JSON file listing checks to run in this process (instead of command and baseline). Each entry needs 'command' and 'baseline' and may override the options below.")
     parser.add_argument("--interval", type=int, default=60, help="Interval in seconds to run the command (default: 60).  Minimum is 10 seconds for resource safety.")
     parser.add_argument("--output", help="Path to output differences to file.")
     parser.add_argument("--format", choices=['yaml', 'json'], default=None, help="Format of the baseline and command output (yaml or json). Autodetect if not specified.  Defaults to YAML if extension is ambiguous.")
     parser.add_argument("--remote", action='store_true', help="Treat the baseline as a URL to fetch the baseline configuration from.")
+    parser.add_argument("--max-diffs", type=int, default=DEFAULT_MAX_DIFFS, help=f"Stop comparing after this many differences (default: {DEFAULT_MAX_DIFFS}). Use 0 for no limit.")
+    parser.add_argument("--ordered", action='store_true', help="Treat list order as significant (faster; use for order-sensitive configs).")
+    parser.add_argument("--schema", help="Path to a Python file defining a msgspec.Struct named 'Schema' for the configuration. Enables a fast equality check before diffing (requires msgspec).")
+    parser.add_argument("--ignore-pattern", action='append', help="Regex (multiline mode) for volatile content such as timestamps to remove from the command output and baseline before parsing. Can be repeated.")
+    parser.add_argument("--ignore-path", action='append', help="DeepDiff path to skip when comparing (e.g. \"root['meta']['updated']\"). Can be repeated.")
+    parser.add_argument("--ignore-path-regex", action='append', help="Regex of DeepDiff paths to skip when comparing. Can be repeated.")
+    parser.add_argument("--persistent-shell", action='store_true', help="Run commands that need a shell (pipes, redirection, ...) in a long-lived bash per job instead of starting bash on every check.")
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.jobs is None and (args.command is None or args.baseline is None):
+        parser.error("command and baseline are required unless --jobs is given")
+    if args.jobs is not None and (args.command is not None or args.baseline is not None):
+        parser.error("command and baseline cannot be combined with --jobs")
+    return args
+
+def split_command(command):
+    """
+    Tokenizes a command so it can be executed directly, without a shell.
+
+    Args:
+        command (str): The command to execute.
+
+    Returns:
+        list: The argument vector.  Returns None if the command uses shell syntax
+        (pipes, redirection, expansion, ...), starts with a bash builtin or keyword or a program
+        not found on PATH, or cannot be tokenized, in which case it must run through bash.
+    """
+    if _SHELL_SYNTAX.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or '=' in argv[0]:  # Leading VAR=value assignments need a shell too
+        return None
+    if argv[0] in _BASH_BUILTINS or shutil.which(argv[0]) is None:
+        return None
+    return argv
 
 def is_valid_interval(interval):
     """
@@ -35,35 +211,293 @@ def is_valid_interval(interval):
         raise ValueError("Interval must be at least 10 seconds to prevent resource exhaustion.")
     return True
 
-def run_command(command):
+class PersistentShell:
+    """
+    A long-lived bash process that runs commands written to its stdin.
+
+    Avoids starting a new bash (exec and dynamic linking) for every check. Each command runs
+    in a subshell with stdin from /dev/null, so it cannot change the shell's state or consume
+    the protocol, and its end is marked on stdout and stderr by a sentinel line; the stdout
+    sentinel carries the exit status.
     """
-    Executes the given command using subprocess and returns the output.
+
+    def __init__(self):
+        self.process = None
+        self.lock = asyncio.Lock()
+        self.marker = f"__CONFIGDRIFT_END_{secrets.token_hex(8)}__".encode()
+
+    async def start(self):
+        """
+        Starts the bash process if it is not running.
+        """
+        if self.process is None or self.process.returncode is not None:
+            self.process = await asyncio.create_subprocess_exec(
+                "/bin/bash", "--noprofile", "--norc",
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                limit=PERSISTENT_SHELL_LIMIT,
+            )
+
+    def close(self):
+        """
+        Terminates the bash process so the next command starts a fresh one.
+        """
+        if self.process is not None and self.process.returncode is None:
+            self.process.kill()
+        self.process = None
+
+    async def run(self, command):
+        """
+        Runs a command in the persistent shell.
+
+        Args:
+            command (str): The command to execute (single line).
+
+        Returns:
+            tuple: The exit status, stdout (bytes) and stderr (bytes) of the command.
+        """
+        marker = self.marker.decode()
+        script = (
+            f"( {command}\n) < /dev/null\n"
+            f"__status=$?; printf '\\n{marker} %d\\n' \"$__status\"; printf '\\n{marker}\\n' >&2\n"
+        )
+        stdout_end = b"\n" + self.marker + b" "
+        stderr_end = b"\n" + self.marker + b"\n"
+
+        async with self.lock:
+            await self.start()
+            try:
+                self.process.stdin.write(script.encode())
+                await self.process.stdin.drain()
+                output, error = await asyncio.gather(
+                    self.process.stdout.readuntil(stdout_end),
+                    self.process.stderr.readuntil(stderr_end),
+                )
+                status = int(await self.process.stdout.readline())
+            except Exception:
+                # The protocol is out of sync (shell died or output too large); start over next time
+                self.close()
+                raise
+        return status, output[:-len(stdout_end)], error[:-len(stderr_end)]
+
+def can_use_persistent_shell(command):
+    """
+    Checks whether a command can safely be sent to a PersistentShell.
+
+    Multi-line commands, here-documents and commands with unbalanced quoting could
+    consume or corrupt the sentinel protocol, so they always get their own bash.
+    """
+    if '\n' in command or '<<' in command:
+        return False
+    try:
+        shlex.split(command)
+    except ValueError:
+        return False
+    return True
+
+async def run_command(command, argv=None, shell=None):
+    """
+    Executes the given command as an asyncio subprocess and returns the output.
+
+    Stdout is read in chunks and hashed as it arrives, so unchanged output can be
+    recognized without parsing it.
 
     Args:
         command (str): The command to execute.
+        argv (list, optional): The pre-tokenized command. If given, it is executed directly
+            instead of through bash. Defaults to None.
+        shell (PersistentShell, optional): Runs the command in this persistent bash instead of
+            starting a new one. Defaults to None.
 
     Returns:
-        str: The output of the command.  Returns None if the command fails.
+        tuple: The raw output of the command (bytes) and its blake2b digest.  Returns None if the command fails.
     """
     try:
+        if shell is not None and not argv:
+            returncode, output, error = await shell.run(command)
+            if returncode != 0:
+                logging.error(f"Command '{command}' failed with error: {error.decode()}")
+                return None
+            return output, hashlib.blake2b(output).digest()
+
         # Execute the command using subprocess with proper security considerations
-        process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, executable="/bin/bash")  # Explicitly use bash
-        output, error = process.communicate()
+        if argv:
+            process = await asyncio.create_subprocess_exec(*argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        else:
+            process = await asyncio.create_subprocess_shell(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, executable="/bin/bash")  # Explicitly use bash
+
+        async def read_stdout():
+            hasher = hashlib.blake2b()
+            chunks = []
+            while True:
+                chunk = await process.stdout.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                chunks.append(chunk)
+            return b''.join(chunks), hasher.digest()
+
+        # Drain stderr concurrently so a chatty command cannot block on a full pipe
+        (output, digest), error = await asyncio.gather(read_stdout(), process.stderr.read())
+        await process.wait()
 
         if process.returncode != 0:
-            logging.error(f"Command execution failed with error: {error.decode()}")
+            logging.error(f"Command '{command}' failed with error: {error.decode()}")
             return None
 
-        return output.decode().strip()
+        return output, digest
 
     except subprocess.CalledProcessError as e:
-        logging.error(f"Command execution failed: {e}")
+        logging.error(f"Command '{command}' failed: {e}")
         return None
     except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}")
+        logging.error(f"An unexpected error occurred running '{command}': {e}")
         return None
 
-def load_baseline(baseline_path, format=None, remote=False):
+def _sidecar_source(stat_result, content):
+    """
+    Describes the exact baseline file a sidecar was built from.
+    """
+    return {
+        'mtime_ns': stat_result.st_mtime_ns,
+        'size': stat_result.st_size,
+        'blake2b': hashlib.blake2b(content).hexdigest(),
+    }
+
+def load_json_sidecar(baseline_path, stat_result, content):
+    """
+    Loads the JSON sidecar cache of a YAML baseline if it was built from exactly this baseline.
+
+    The sidecar records the mtime, size and content hash of its source and is only used when all
+    three match. It must also be owned by the baseline's owner and not be group/world-writable,
+    so it cannot be used to swap out the known-good baseline.
+
+    Args:
+        baseline_path (str): The path to the YAML baseline file.
+        stat_result (os.stat_result): The stat of the baseline file.
+        content (bytes): The raw content of the baseline file.
+
+    Returns:
+        dict: The cached baseline configuration.  Returns None if there is no usable cache.
+    """
+    sidecar_path = baseline_path + SIDECAR_SUFFIX
+    try:
+        sidecar_stat = os.stat(sidecar_path)
+        if sidecar_stat.st_uid != stat_result.st_uid or sidecar_stat.st_mode & 0o022:
+            logging.debug(f"Ignoring sidecar cache {sidecar_path}: unexpected owner or permissions.")
+            return None
+        with open(sidecar_path, 'rb') as f:
+            sidecar = json_loads(f.read())
+        if not isinstance(sidecar, dict) or sidecar.get('source') != _sidecar_source(stat_result, content):
+            return None
+        return sidecar.get('baseline')
+    except (OSError, ValueError):
+        return None
+
+def write_json_sidecar(baseline_path, baseline, stat_result, content):
+    """
+    Writes a JSON copy of a parsed YAML baseline next to it so later loads can skip YAML parsing.
+
+    The cache is only written when the baseline survives a JSON round trip unchanged
+    (e.g., no dates or non-string keys); failures are not fatal.
+
+    Args:
+        baseline_path (str): The path to the YAML baseline file.
+        baseline (dict): The parsed baseline configuration.
+        stat_result (os.stat_result): The stat of the baseline file.
+        content (bytes): The raw content of the baseline file.
+    """
+    try:
+        if json_loads(json_dumps(baseline)) != baseline:
+            logging.debug(f"Baseline {baseline_path} is not JSON-compatible; skipping sidecar cache.")
+            return
+        data = json_dumps({'source': _sidecar_source(stat_result, content), 'baseline': baseline})
+        with open(baseline_path + SIDECAR_SUFFIX, 'wb') as f:
+            f.write(data)
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"Could not write sidecar cache for {baseline_path}: {e}")
+
+def _remote_validators(response):
+    """
+    Extracts the headers that identify a version of a remote baseline.
+    """
+    return (
+        response.headers.get('ETag'),
+        response.headers.get('Last-Modified'),
+        response.headers.get('Content-Length'),
+    )
+
+def fetch_remote_baseline(url, cached):
+    """
+    Fetches a remote baseline, avoiding the download when it is unchanged since it was cached.
+
+    Sends If-None-Match/If-Modified-Since when validators are known. For servers that ignore
+    conditional requests, later checks compare the validators from a HEAD request instead.
+    A downloaded body identical to the cached one is not parsed again.
+
+    Args:
+        url (str): The URL of the baseline.
+        cached (dict): The cache entry from the previous load, or None.
+
+    Returns:
+        tuple: The downloaded content (None when the cached baseline is still current) and
+        the cache entry to store.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    session = get_http_session()
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached['validators']
+        if cached.get('head_only'):
+            head = session.head(url, allow_redirects=True)
+            if head.ok and _remote_validators(head) == cached['validators']:
+                return None, cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    response = session.get(url, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return None, cached
+    response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+
+    validators = _remote_validators(response)
+    entry = {
+        'validators': validators,
+        'content_digest': hashlib.blake2b(response.content).digest(),
+    }
+    if cached is not None and entry['content_digest'] == cached['content_digest']:
+        # Unchanged body: if it came back in full despite matching validators, the server ignores
+        # conditional requests, so switch to HEAD checks for this baseline.
+        entry['head_only'] = bool(headers) and validators == cached['validators']
+        for key in ('baseline', 'digest', 'structs'):
+            if key in cached:
+                entry[key] = cached[key]
+        return None, entry
+    return response.content, entry
+
+def resolve_baseline_format(baseline_path, format=None):
+    """
+    Determines the format of a baseline from the explicit format or the file extension.
+
+    Args:
+        baseline_path (str): The path to the baseline file or URL.
+        format (str, optional): The explicitly requested format. Defaults to None (autodetect).
+
+    Returns:
+        str: 'yaml' or 'json' (or the explicit format, unchanged).
+    """
+    if format is not None:
+        return format
+    if baseline_path.lower().endswith('.yaml') or baseline_path.lower().endswith('.yml'):
+        return 'yaml'
+    elif baseline_path.lower().endswith('.json'):
+        return 'json'
+    return 'yaml' # default to yaml if extension is ambiguous.
+
+def load_baseline(baseline_path, format=None, remote=False, ignore_pattern=None):
     """
     Loads the baseline configuration from a file or URL.
 
@@ -71,60 +505,112 @@ def load_baseline(baseline_path, format=None, remote=False):
         baseline_path (str): The path to the baseline file or URL.
         format (str, optional): The format of the baseline file (yaml or json). Defaults to None (autodetect).
         remote (bool, optional):  If True, treat the path as a URL.  Defaults to False.
+        ignore_pattern (re.Pattern, optional): Compiled pattern (from compile_ignore_patterns) whose matches are removed
+            from the raw baseline before parsing. Defaults to None.
 
     Returns:
         dict: The baseline configuration as a dictionary.  Returns None if loading fails.
     """
+    entry = load_baseline_entry(baseline_path, format, remote, ignore_pattern)
+    return entry['baseline'] if entry is not None else None
+
+def load_baseline_entry(baseline_path, format=None, remote=False, ignore_pattern=None):
+    """
+    Loads the baseline configuration from a file or URL and returns its cache entry.
+
+    The entry also carries values derived from the baseline (digest, schema structs), so
+    callers can reuse them without searching the cache.
+
+    Args:
+        baseline_path (str): The path to the baseline file or URL.
+        format (str, optional): The format of the baseline file (yaml or json). Defaults to None (autodetect).
+        remote (bool, optional):  If True, treat the path as a URL.  Defaults to False.
+        ignore_pattern (re.Pattern, optional): Compiled pattern (from compile_ignore_patterns) whose matches are removed
+            from the raw baseline before parsing. Defaults to None.
+
+    Returns:
+        dict: The cache entry, with the parsed baseline under 'baseline'.  Returns None if loading fails.
+    """
 
     try:
+        if format is None:
+            format = resolve_baseline_format(baseline_path)
+
+        if format not in ('yaml', 'json'):
+            logging.error(f"Unsupported format: {format}")
+            return None
+
+        cache_key = (baseline_path, format, ignore_pattern.pattern if ignore_pattern else None)
+        cached = _BASELINE_CACHE.get(cache_key)
+
         if remote:
-            response = requests.get(baseline_path)
-            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            content = response.text
+            content, entry = fetch_remote_baseline(baseline_path, cached)
+            if content is None:
+                _BASELINE_CACHE[cache_key] = entry
+                return entry
         else:
-            with open(baseline_path, 'r') as f:
+            stat_result = os.stat(baseline_path)
+            if cached is not None and cached.get('mtime_ns') == stat_result.st_mtime_ns:
+                return cached
+            entry = {'mtime_ns': stat_result.st_mtime_ns}
+
+            with open(baseline_path, 'rb') as f:
                 content = f.read()
 
-        if format is None:
-            if baseline_path.lower().endswith('.yaml') or baseline_path.lower().endswith('.yml'):
-                format = 'yaml'
-            elif baseline_path.lower().endswith('.json'):
-                format = 'json'
+            # The sidecar holds the unfiltered baseline, so it is only usable without ignore patterns
+            use_sidecar = format == 'yaml' and ignore_pattern is None
+            if use_sidecar:
+                entry['baseline'] = load_json_sidecar(baseline_path, stat_result, content)
+                if entry['baseline'] is not None:
+                    content = None
+
+        if content is not None:
+            raw_content = content
+            if ignore_pattern is not None:
+                content = strip_ignored(content, ignore_pattern)
+            if format == 'yaml':
+                entry['baseline'] = yaml.load(content, Loader=_YamlLoader)
+                if not remote and use_sidecar:
+                    write_json_sidecar(baseline_path, entry['baseline'], stat_result, raw_content)
             else:
-                format = 'yaml' # default to yaml if extension is ambiguous.
+                entry['baseline'] = json_loads(content)
 
-
-        if format == 'yaml':
-            return yaml.safe_load(content)
-        elif format == 'json':
-            return json.loads(content)
-        else:
-            logging.error(f"Unsupported format: {format}")
-            return None
+        _BASELINE_CACHE[cache_key] = entry
+        return entry
 
     except FileNotFoundError:
         logging.error(f"Baseline file not found: {baseline_path}")
         return None
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Error fetching baseline from URL: {e}")
-        return None
     except yaml.YAMLError as e:
         logging.error(f"Error parsing YAML: {e}")
         return None
     except json.JSONDecodeError as e:
         logging.error(f"Error parsing JSON: {e}")
         return None
+    except OSError as e:
+        # requests' RequestException is an OSError, so this also covers remote fetch errors
+        if remote:
+            logging.error(f"Error fetching baseline from URL: {e}")
+        else:
+            logging.error(f"An unexpected error occurred while loading the baseline: {e}")
+        return None
     except Exception as e:
         logging.error(f"An unexpected error occurred while loading the baseline: {e}")
         return None
 
-def compare_configurations(baseline, current_config):
+def compare_configurations(baseline, current_config, max_diffs=DEFAULT_MAX_DIFFS, ordered=False, exclude_paths=None, exclude_regex_paths=None):
     """
     Compares the baseline configuration with the current configuration using DeepDiff.
 
     Args:
         baseline (dict): The baseline configuration.
         current_config (dict): The current configuration.
+        max_diffs (int, optional): Stop after reporting this many differences; None for no limit.
+            Defaults to DEFAULT_MAX_DIFFS.
+        ordered (bool, optional): If True, compare lists positionally instead of ignoring order.
+            Defaults to False.
+        exclude_paths (list, optional): DeepDiff paths (e.g. "root['meta']") to skip. Defaults to None.
+        exclude_regex_paths (list, optional): Compiled patterns of DeepDiff paths to skip. Defaults to None.
 
     Returns:
         dict: The differences between the configurations as a dictionary.  Returns None if either input is None.
@@ -133,7 +619,20 @@ def compare_configurations(baseline, current_config):
         return None
 
     try:
-        diff = DeepDiff(baseline, current_config, ignore_order=True)
+        from deepdiff import DeepDiff  # Imported lazily; identical configurations never need it
+
+        diff = DeepDiff(
+            baseline,
+            current_config,
+            ignore_order=not ordered,
+            max_diffs=max_diffs,
+            cutoff_distance_for_pairs=0.3,
+            cutoff_intersection_for_pairs=0.6,
+            cache_size=5000,
+            cache_tuning_sample_size=500,
+            exclude_paths=exclude_paths,
+            exclude_regex_paths=exclude_regex_paths,
+        )
         return diff
     except Exception as e:
         logging.error(f"Error comparing configurations: {e}")
@@ -148,18 +647,144 @@ def save_differences(differences, output_path):
         output_path (str): The path to the output file.
     """
     try:
-        with open(output_path, 'w') as f:
-            json.dump(differences, f, indent=4)  # Use JSON for easy readability
+        data = json_dumps(differences, pretty=True)  # Use JSON for easy readability
+        with open(output_path, 'wb') as f:
+            f.write(data)  # Single write of the fully serialized report
         logging.info(f"Differences saved to: {output_path}")
     except Exception as e:
         logging.error(f"Error saving differences to file: {e}")
 
+def looks_like_json(content):
+    """
+    Checks whether content (bytes or str) starts like a JSON object or array.
+    """
+    head = content[:AUTODETECT_PEEK_SIZE].lstrip()
+    return head[:1] in (b'{', b'[', '{', '[')
+
+@lru_cache(maxsize=None)
+def load_schema(schema_path):
+    """
+    Loads the msgspec.Struct named Schema from a Python file.
+
+    The module is registered in sys.modules under a name unique to the path, so postponed
+    annotations and forward references resolve, and the schema's types are resolved here
+    so a bad schema fails at startup instead of on every check.
+
+    Args:
+        schema_path (str): The path to the schema file.
+
+    Returns:
+        type: The Schema struct type.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+        ValueError: If the file cannot be loaded or does not define a valid Schema struct.
+    """
+    import msgspec  # Optional dependency, only needed with --schema
+    import msgspec.json
+
+    path_hash = hashlib.blake2b(os.path.abspath(schema_path).encode(), digest_size=8).hexdigest()
+    module_name = f"configdrift_schema_{path_hash}"
+    spec = importlib.util.spec_from_file_location(module_name, schema_path)
+    if spec is None:
+        raise ValueError(f"Cannot load schema file: {schema_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        del sys.modules[module_name]
+        raise ValueError(f"Error loading schema file {schema_path}: {e}") from e
+
+    schema = getattr(module, 'Schema', None)
+    if not (isinstance(schema, type) and issubclass(schema, msgspec.Struct)):
+        raise ValueError(f"Schema file must define a msgspec.Struct named 'Schema': {schema_path}")
+    try:
+        msgspec.json.Decoder(schema)  # Resolves all annotations now
+    except Exception as e:
+        raise ValueError(f"Invalid schema in {schema_path}: {e}") from e
+    return schema
+
+def schema_has_defaults(schema):
+    """
+    Checks whether a schema, or any struct nested in it, has fields with defaults.
+
+    A missing key decodes to the field's default, so struct equality cannot tell a dropped
+    key from one set to its default value.
+
+    Args:
+        schema (type): The msgspec.Struct type to inspect.
+
+    Returns:
+        bool: True if any field is optional.
+    """
+    import msgspec.inspect
+
+    seen = set()
+    pending = [msgspec.inspect.type_info(schema)]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, tuple):
+            pending.extend(node)
+            continue
+        if not isinstance(node, (msgspec.inspect.Type, msgspec.inspect.Field)) or id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, msgspec.inspect.Field) and not node.required:
+            return True
+        pending.extend(getattr(node, name) for name in node.__struct_fields__)
+    return False
+
+def decode_with_schema(config_string, schema, format=None):
+    """
+    Decodes raw command output straight into a schema struct with msgspec.
+
+    Args:
+        config_string (bytes or str): The configuration as raw command output.
+        schema (type): The msgspec.Struct type to decode into.
+        format (str, optional): The format of the output (yaml or json). Defaults to None (autodetect).
+
+    Returns:
+        The decoded struct.  Returns None if the output does not match the schema.
+    """
+    import msgspec
+
+    if format is None:
+        format = 'json' if looks_like_json(config_string) else 'yaml'
+    try:
+        if format == 'json':
+            return msgspec.json.decode(config_string, type=schema)
+        return msgspec.yaml.decode(config_string, type=schema)
+    except (msgspec.DecodeError, yaml.YAMLError):
+        return None
+
+def baseline_struct(entry, schema):
+    """
+    Converts a loaded baseline into a schema struct, computed once and kept in its cache entry.
+
+    Args:
+        entry (dict): The baseline cache entry returned by load_baseline_entry.
+        schema (type): The msgspec.Struct type to convert into.
+
+    Returns:
+        The baseline struct.  Returns None if the baseline does not match the schema.
+    """
+    import msgspec
+
+    structs = entry.setdefault('structs', {})
+    if schema not in structs:
+        try:
+            structs[schema] = msgspec.convert(entry['baseline'], type=schema)
+        except msgspec.ValidationError:
+            structs[schema] = None
+    return structs[schema]
+
 def format_output(config_string, format):
   """
   Formats the string output from a command into a data format.
 
   Args:
-    config_string (str): The configuration as a string.
+    config_string (bytes or str): The configuration as raw command output.
     format (str, optional): The format to output to (yaml or json).
 
   Returns:
@@ -169,16 +794,21 @@ def format_output(config_string, format):
 
   try:
     if format == 'yaml':
-      return yaml.safe_load(config_string)
+      return yaml.load(config_string, Loader=_YamlLoader)
     elif format == 'json':
-      return json.loads(config_string)
+      return json_loads(config_string)
     else:
-      # Attempt autodetection
+      # Attempt autodetection, trying JSON first when the output looks like a JSON document
+      if looks_like_json(config_string):
+        try:
+          return json_loads(config_string)
+        except json.JSONDecodeError:
+          pass
       try:
-        return yaml.safe_load(config_string)
+        return yaml.load(config_string, Loader=_YamlLoader)
       except yaml.YAMLError:
         try:
-          return json.loads(config_string)
+          return json_loads(config_string)
         except json.JSONDecodeError:
           logging.error("Could not autodetect the configuration format (YAML or JSON), and no format specified.  Returning None.")
           return None
@@ -193,7 +823,7 @@ def format_output(config_string, format):
     logging.error(f"An unexpected error occurred while loading the baseline: {e}")
     return None
 
-def check_configuration(command, baseline_path, output_path=None, format=None, remote=False):
+async def check_configuration(command, baseline_path, output_path=None, format=None, remote=False, max_diffs=DEFAULT_MAX_DIFFS, ordered=False, argv=None, baseline_format=None, schema=None, ignore_pattern=None, exclude_paths=None, exclude_regex_paths=None, shell=None, state=None, name=None):
     """
     Runs the command, loads the baseline, compares the configurations, and saves the differences.
 
@@ -202,16 +832,69 @@ def check_configuration(command, baseline_path, output_path=None, format=None, r
         baseline_path (str): The path to the baseline file.
         output_path (str, optional): The path to save the differences to. Defaults to None.
         format (str, optional): The format of the baseline file (yaml or json). Defaults to None.
+        remote (bool, optional): If True, treat the baseline path as a URL. Defaults to False.
+        max_diffs (int, optional): Maximum number of differences to report. Defaults to DEFAULT_MAX_DIFFS.
+        ordered (bool, optional): If True, treat list order as significant. Defaults to False.
+        argv (list, optional): The pre-tokenized command, executed without a shell. Defaults to None.
+        baseline_format (str, optional): The resolved baseline format; overrides format for the baseline only.
+            Defaults to None.
+        schema (type, optional): A msgspec.Struct describing the configuration. When given, both sides
+            are decoded into it and compared with ==, and DeepDiff only runs if they differ. Defaults to None.
+        ignore_pattern (re.Pattern, optional): Compiled pattern (from compile_ignore_patterns) whose matches are removed from
+            both the command output and the baseline before parsing. Defaults to None.
+        exclude_paths (list, optional): DeepDiff paths to skip when diffing. Defaults to None.
+        exclude_regex_paths (list, optional): Compiled patterns of DeepDiff paths to skip. Defaults to None.
+        shell (PersistentShell, optional): Persistent bash to run shell commands in. Defaults to None.
+        state (dict, optional): Per-job state kept across checks (the digest of the last output that
+            matched the baseline). Defaults to None (nothing is remembered).
+        name (str, optional): The label used in log messages. Defaults to None (the command).
     """
-    logging.info("Running configuration check...")
+    label = name or command
+    logging.info(f"Running configuration check '{label}'...")
 
     # Run the command to get the current configuration
-    current_config_string = run_command(command)
+    result = await run_command(command, argv, shell)
+
+    if result is None:
+        logging.error(f"Failed to retrieve current configuration for '{label}'. Aborting.")
+        return
+    current_config_string, output_digest = result
+
+    # Drop volatile content (timestamps, PIDs, ...) before parsing, and hash what remains so
+    # output that only differs in ignored parts still takes the no-parse fast path below
+    if ignore_pattern is not None:
+        current_config_string = strip_ignored(current_config_string, ignore_pattern)
+        output_digest = hashlib.blake2b(current_config_string).digest()
+
+    # Load the baseline configuration; remote fetches run in a worker thread so they don't block other checks
+    if remote:
+        baseline_entry = await asyncio.to_thread(load_baseline_entry, baseline_path, baseline_format or format, remote, ignore_pattern)
+    else:
+        baseline_entry = load_baseline_entry(baseline_path, baseline_format or format, remote, ignore_pattern)
+
+    baseline = baseline_entry['baseline'] if baseline_entry is not None else None
+    if baseline is None:
+        logging.error(f"Failed to load baseline configuration {baseline_path} for '{label}'. Aborting.")
+        return
+
+    if state is None:
+        state = {}
 
-    if current_config_string is None:
-        logging.error("Failed to retrieve current configuration. Aborting.")
+    # Output identical to the last clean check of this job against the same baseline needs no parsing at all
+    last_clean = state.get('last_clean')
+    if last_clean is not None and last_clean[0] == output_digest and last_clean[1] is baseline:
+        logging.info(f"No configuration drift detected in '{label}'.")
         return
 
+    # With a schema, decode straight into structs and compare them in C; fall through to DeepDiff
+    # for a readable report when they differ or don't match the schema
+    if schema is not None:
+        current_struct = decode_with_schema(current_config_string, schema, format)
+        if current_struct is not None and current_struct == baseline_struct(baseline_entry, schema):
+            state['last_clean'] = (output_digest, baseline)
+            logging.info(f"No configuration drift detected in '{label}'.")
+            return
+
     current_config = None
     if format:
       current_config = format_output(current_config_string, format)
@@ -219,50 +902,295 @@ def check_configuration(command, baseline_path, output_path=None, format=None, r
       current_config = format_output(current_config_string, None)
 
     if current_config is None:
-      logging.error("Failed to parse current configuration. Aborting")
+      logging.error(f"Failed to parse current configuration for '{label}'. Aborting")
       return
 
-    # Load the baseline configuration
-    baseline = load_baseline(baseline_path, format, remote)
-
-    if baseline is None:
-        logging.error("Failed to load baseline configuration. Aborting.")
+    # Skip the full diff when both sides are identical
+    current_digest = config_digest(current_config)
+    if current_digest is not None and current_digest == baseline_digest(baseline_entry):
+        state['last_clean'] = (output_digest, baseline)
+        logging.info(f"No configuration drift detected in '{label}'.")
         return
 
     # Compare the configurations
-    differences = compare_configurations(baseline, current_config)
+    differences = compare_configurations(baseline, current_config, max_diffs, ordered, exclude_paths, exclude_regex_paths)
 
-    if differences:
-        logging.warning("Configuration drift detected!")
-        logging.info(f"Differences: {differences}")
+    # DeepDiff may return a partial (even empty) result once max_diffs is hit, which still means drift
+    limit_reached = differences is not None and differences.get_stats().get('MAX DIFF LIMIT REACHED', False)
+
+    if differences or limit_reached:
+        state.pop('last_clean', None)
+        logging.warning(f"Configuration drift detected in '{label}'!")
+        if limit_reached:
+            logging.warning(f"Stopped comparing '{label}' after {max_diffs} differences; the reported differences may be incomplete.")
+        logging.info(f"Differences in '{label}': {differences}")
 
         if output_path:
             save_differences(differences, output_path)
     else:
-        logging.info("No configuration drift detected.")
+        if differences is not None:
+            state['last_clean'] = (output_digest, baseline)
+        logging.info(f"No configuration drift detected in '{label}'.")
+
+def compile_ignore_patterns(patterns):
+    """
+    Compiles ignore patterns into a single str regex that matches any of them.
+
+    Patterns are applied to text (see strip_ignored), so classes such as \\w and \\d
+    keep their Unicode meaning.
+
+    Args:
+        patterns (list): The regex patterns, or None.
+
+    Returns:
+        re.Pattern: The combined pattern, compiled in multiline mode.  Returns None if there are no patterns.
+
+    Raises:
+        re.error: If a pattern does not compile.
+    """
+    if not patterns:
+        return None
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.MULTILINE)
+
+def compile_path_regexes(patterns):
+    """
+    Compiles regexes of DeepDiff paths to skip when diffing.
+
+    Args:
+        patterns (list): The regex patterns, or None.
+
+    Returns:
+        list: The compiled patterns.  Returns None if there are no patterns.
+
+    Raises:
+        re.error: If a pattern does not compile.
+    """
+    if not patterns:
+        return None
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return [re.compile(pattern) for pattern in patterns]
+
+def strip_ignored(content, ignore_pattern):
+    """
+    Removes everything matching an ignore pattern from raw content.
+
+    The bytes are decoded as UTF-8 with surrogateescape, so non-UTF-8 input round-trips unchanged.
+
+    Args:
+        content (bytes): The raw content.
+        ignore_pattern (re.Pattern): The pattern built by compile_ignore_patterns.
+
+    Returns:
+        bytes: The content without the ignored parts.
+    """
+    text = content.decode('utf-8', 'surrogateescape')
+    return ignore_pattern.sub('', text).encode('utf-8', 'surrogateescape')
+
+def make_job(command, baseline, interval=60, output=None, format=None, remote=False, max_diffs=DEFAULT_MAX_DIFFS, ordered=False, schema=None, ignore_patterns=None, ignore_paths=None, ignore_path_regexes=None, persistent_shell=False, name=None):
+    """
+    Builds a scheduled job, resolving everything that stays constant across its checks.
+
+    Args:
+        command (str): The command to execute.
+        baseline (str): The path to the baseline file or URL.
+        interval (int, optional): Interval in seconds between checks. Defaults to 60.
+        output (str, optional): The path to save the differences to. Defaults to None.
+        format (str, optional): The format of the baseline and command output (yaml or json). Defaults to None.
+        remote (bool, optional): If True, treat the baseline as a URL. Defaults to False.
+        max_diffs (int, optional): Maximum number of differences to report; 0 or None for no limit.
+            Defaults to DEFAULT_MAX_DIFFS.
+        ordered (bool, optional): If True, treat list order as significant. Defaults to False.
+        schema (str, optional): Path to a Python file defining a msgspec.Struct named Schema. Ignored, with a
+            warning, if any of its fields has a default. Defaults to None.
+        ignore_patterns (list, optional): Regexes for content to drop from both sides before parsing. Defaults to None.
+        ignore_paths (list, optional): DeepDiff paths to skip when diffing. Defaults to None.
+        ignore_path_regexes (list, optional): Regexes of DeepDiff paths to skip when diffing. Defaults to None.
+        persistent_shell (bool, optional): If True, run commands that need a shell in a long-lived bash
+            instead of starting one per check. Defaults to False.
+        name (str, optional): A short label for the job's log messages. Defaults to None (the command).
+
+    Returns:
+        dict: The job, with its interval and the keyword arguments for check_configuration.
+
+    Raises:
+        ValueError: If the interval is too short, the format or a flag is invalid, the schema file is invalid
+            or a pattern does not compile.
+        ImportError: If a schema is given but msgspec is not installed.
+    """
+    is_valid_interval(interval)
+    # Jobs files bypass argparse, so check what its choices and store_true flags would guarantee
+    if format not in (None, 'yaml', 'json'):
+        raise ValueError(f"Invalid format {format!r}; expected 'yaml' or 'json'.")
+    for option, value in (('remote', remote), ('ordered', ordered), ('persistent_shell', persistent_shell)):
+        if not isinstance(value, bool):
+            raise ValueError(f"Option '{option}' must be true or false, not {value!r}.")
+    argv = split_command(command)
+    schema_type = load_schema(schema) if schema else None
+    if schema_type is not None and schema_has_defaults(schema_type):
+        # A dropped key would decode to its default and compare equal, hiding the removal
+        logging.warning(f"Schema {schema} has fields with defaults; comparing with DeepDiff only so removed keys are still reported.")
+        schema_type = None
+    return {
+        'interval': interval,
+        'check': {
+            'command': command,
+            'name': name,
+            'baseline_path': baseline,
+            'output_path': output,
+            'format': format,
+            'remote': remote,
+            'max_diffs': max_diffs if max_diffs and max_diffs > 0 else None,
+            'ordered': ordered,
+            # Tokenize the command and resolve the baseline format once rather than per check
+            'argv': argv,
+            'baseline_format': resolve_baseline_format(baseline, format),
+            'schema': schema_type,
+            # Compile the patterns once at startup rather than per check
+            'ignore_pattern': compile_ignore_patterns(ignore_patterns),
+            'exclude_paths': [ignore_paths] if isinstance(ignore_paths, str) else ignore_paths or None,
+            'exclude_regex_paths': compile_path_regexes(ignore_path_regexes),
+            # Directly executed commands never start a bash, so only shell commands benefit
+            'shell': PersistentShell() if persistent_shell and argv is None and can_use_persistent_shell(command) else None,
+            # Results depend on all of the options above, so the last clean output is remembered per job
+            'state': {},
+        },
+    }
+
+def load_jobs(jobs_path, args):
+    """
+    Loads the list of checks to schedule from a YAML or JSON file.
+
+    The file holds a list of mappings (or a mapping with a 'jobs' list). Each entry needs
+    'command' and 'baseline'; other options default to the command-line values, except
+    that several jobs cannot share one output file.
+
+    Args:
+        jobs_path (str): The path to the jobs file.
+        args (argparse.Namespace): The parsed command-line arguments providing defaults.
+
+    Returns:
+        list: The jobs, as built by make_job.
+
+    Raises:
+        ValueError: If the file is malformed, an entry is invalid or jobs share an output file.
+    """
+    with open(jobs_path, 'rb') as f:
+        content = f.read()
+    if resolve_baseline_format(jobs_path) == 'json':
+        entries = json_loads(content)
+    else:
+        entries = yaml.load(content, Loader=_YamlLoader)
+    if isinstance(entries, dict):
+        entries = entries.get('jobs')
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"Jobs file must contain a non-empty list of jobs: {jobs_path}")
+    if args.output and len(entries) > 1:
+        raise ValueError("--output cannot be shared by several jobs; set 'output' per job instead.")
+
+    defaults = {
+        'interval': args.interval,
+        'output': args.output,
+        'format': args.format,
+        'remote': args.remote,
+        'max_diffs': args.max_diffs,
+        'ordered': args.ordered,
+        'schema': args.schema,
+        'ignore_patterns': args.ignore_pattern,
+        'ignore_paths': args.ignore_path,
+        'ignore_path_regexes': args.ignore_path_regex,
+        'persistent_shell': args.persistent_shell,
+    }
+    jobs = []
+    outputs = set()
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict) or 'command' not in entry or 'baseline' not in entry:
+            raise ValueError(f"Job {index} must be a mapping with 'command' and 'baseline'.")
+        unknown = set(entry) - set(defaults) - {'command', 'baseline', 'name'}
+        if unknown:
+            raise ValueError(f"Job {index} has unknown keys: {', '.join(sorted(unknown))}")
+        output = entry.get('output')
+        if output:
+            if output in outputs:
+                raise ValueError(f"Job {index} writes to the same output as an earlier job: {output}")
+            outputs.add(output)
+        jobs.append(make_job(**{**defaults, **entry}))
+    return jobs
+
+def _log_task_exception(task):
+    """
+    Logs an exception raised by a finished check task instead of letting it surface only at garbage collection.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        logging.error("Configuration check failed unexpectedly", exc_info=task.exception())
+
+async def scheduler_main(jobs):
+    """
+    Runs every job's configuration check at its interval on one asyncio event loop.
+
+    Jobs are kept in a heap ordered by their next monotonic deadline, so the loop only wakes
+    when a check is due and the schedule does not drift. Each check runs as its own task,
+    so a slow command or fetch does not delay other checks; a job whose previous check is
+    still running skips that tick rather than piling up overlapping runs. Persistent shells
+    are closed when the scheduler exits.
+
+    Args:
+        jobs (list): The jobs to run, as built by make_job.
+    """
+    loop = asyncio.get_running_loop()
+    running = {}  # job index -> task of its current check
+    now = loop.time()  # loop.time() is monotonic
+    heap = [(now + job['interval'], index) for index, job in enumerate(jobs)]
+    heapq.heapify(heap)
+    try:
+        while True:
+            await asyncio.sleep(max(0, heap[0][0] - loop.time()))
+            next_run, index = heapq.heappop(heap)
+            job = jobs[index]
+            heapq.heappush(heap, (next_run + job['interval'], index))
+
+            previous = running.get(index)
+            if previous is not None and not previous.done():
+                logging.warning(f"Previous check of '{job['check']['name'] or job['check']['command']}' is still running; skipping this run.")
+                continue
+
+            task = asyncio.create_task(check_configuration(**job['check']))
+            running[index] = task
+            task.add_done_callback(_log_task_exception)
+    finally:
+        for job in jobs:
+            shell = job['check']['shell']
+            if shell is not None and shell.process is not None:
+                process = shell.process
+                shell.close()
+                # Reap the bash while the loop is still running
+                await process.wait()
 
 def main():
     """
-    Main function to parse arguments, schedule the configuration check, and run the scheduler.
+    Main function to parse arguments, schedule the configuration checks, and run the scheduler.
     """
     args = setup_argparse()
 
     try:
-        is_valid_interval(args.interval)
-    except ValueError as e:
+        if args.jobs:
+            jobs = load_jobs(args.jobs, args)
+        else:
+            jobs = [make_job(args.command, args.baseline, args.interval, args.output, args.format, args.remote, args.max_diffs, args.ordered, args.schema, args.ignore_pattern, args.ignore_path, args.ignore_path_regex, args.persistent_shell)]
+    except (OSError, ValueError, TypeError, ImportError, re.error, yaml.YAMLError) as e:
         logging.error(e)
         return
 
-    # Schedule the configuration check
-    schedule.every(args.interval).seconds.do(check_configuration, args.command, args.baseline, args.output, args.format, args.remote)
-
-    logging.info(f"Scheduled configuration check every {args.interval} seconds. Press Ctrl+C to exit.")
+    if len(jobs) == 1:
+        logging.info(f"Scheduled configuration check every {jobs[0]['interval']} seconds. Press Ctrl+C to exit.")
+    else:
+        logging.info(f"Scheduled {len(jobs)} configuration checks. Press Ctrl+C to exit.")
 
     # Run the scheduler
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+        asyncio.run(scheduler_main(jobs))
     except KeyboardInterrupt:
         logging.info("Exiting...")
 
@@ -282,4 +1210,12 @@ if __name__ == "__main__":
 # 4. Check for changes in a remote baseline.
 #    python main.py "cat /etc/config.txt" https://example.com/baseline.yaml --remote
 
+# 5. Run several checks from one process, listed in jobs.yaml:
+#    - command: "cat /etc/config.txt"
+#      baseline: baseline.yaml
+#    - command: "cat /etc/app.json"
+#      baseline: app.json
+#      interval: 300
+#    python main.py --jobs jobs.yaml
+
 # Note: Replace placeholder paths with actual file paths for your system. The 'cat' command is just an example and should be replaced with a safer alternative, if possible.
\ No newline at end of file